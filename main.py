@@ -7,6 +7,7 @@ from src.constants import GameConfig, Player, GameState
 from src.board import GameBoard
 from src.game_play import GameLogic
 from src.ai_logic import AILogic
+from src.game_record import append_game
 from src.UI import UIManager
 
 class CaroGame:
@@ -46,6 +47,16 @@ class CaroGame:
         self.game_state = GameState.PLAYING
         self.current_player = Player.HUMAN
     
+    def save_game_record(self):
+        if not GameConfig.LOG_GAMES:
+            return
+        # The human always moves first (see start_game)
+        try:
+            append_game(GameConfig.GAME_LOG_FILE, self.game_logic.move_history,
+                        Player.HUMAN, self.game_state)
+        except OSError as e:
+            print(f"Could not save game record: {e}", file=sys.stderr)
+    
     def ai_move(self):
         if self.current_difficulty is None:
             return
@@ -60,7 +71,7 @@ class CaroGame:
         else:  # Endgame
             depth = max(1, self.current_difficulty - 2)
         
-        _, best_move = self.ai_logic.minimax(depth, float('-inf'), float('inf'), True)
+        _, best_move = self.ai_logic.search(depth)
         
         if best_move:
             row, col = best_move
@@ -74,6 +85,9 @@ class CaroGame:
                 self.game_state = GameState.DRAW
             else:
                 self.current_player = Player.HUMAN
+            
+            if self.game_state != GameState.PLAYING:
+                self.save_game_record()
     
     def handle_click(self, mouseX, mouseY):
         if self.show_difficulty_menu:
@@ -106,6 +120,9 @@ class CaroGame:
                 self.game_state = GameState.DRAW
             else:
                 self.current_player = Player.AI
+            
+            if self.game_state != GameState.PLAYING:
+                self.save_game_record()
     
     def update_display(self):
         self.screen.fill(GameConfig.Colors.WHITE)
@@ -1,10 +1,18 @@
+import json
+import os
 import random
+import warnings
 from src.constants import GameConfig, Player, Direction
 from typing import List, Tuple, Optional
 
 class AILogic:
-    def __init__(self, game_logic):
+    def __init__(self, game_logic, use_lmr: Optional[bool] = None,
+                 use_null_move: Optional[bool] = None):
         self.game_logic = game_logic
+        # Read the config at construction time so runtime toggles take effect
+        self.use_lmr = GameConfig.AI.USE_LMR if use_lmr is None else use_lmr
+        self.use_null_move = GameConfig.AI.USE_NULL_MOVE if use_null_move is None else use_null_move
+        self.nodes_searched = 0
         self.pattern_values = {
             # Winning condition
             (5, 0): 1000000,   # Immediate win
@@ -24,6 +32,36 @@ class AILogic:
             (4, 1): 30000,      # Four with one blocked end
             (3, 1): 7000,      # Three with one blocked end
         }
+        self.load_weights(GameConfig.AI.WEIGHTS_FILE)
+    
+    def load_weights(self, path: str) -> None:
+        """Override pattern_values with tuned weights, if a valid weights file exists"""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            weights = {}
+            for key, value in data["pattern_values"].items():
+                player_count, opponent_count = (int(n) for n in key.split(","))
+                weights[(player_count, opponent_count)] = int(value)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            warnings.warn(f"Ignoring {path}: cannot read weights ({e!r})")
+            return
+        
+        # A weight near the win score would let the static eval outrank a real win
+        for key, value in weights.items():
+            if key not in self.pattern_values:
+                warnings.warn(f"Ignoring {path}: unknown pattern {key}")
+                return
+            if key == (5, 0):
+                valid = value == self.pattern_values[key]
+            else:
+                valid = GameConfig.AI.MIN_PATTERN_WEIGHT <= value <= GameConfig.AI.MAX_PATTERN_WEIGHT
+            if not valid:
+                warnings.warn(f"Ignoring {path}: weight {value} for pattern {key} is out of range")
+                return
+        self.pattern_values.update(weights)
         
     def evaluate_window(self, window: List[int], player: Player) -> int:
         """Evaluate a window of spaces for scoring potential"""
@@ -146,9 +184,22 @@ class AILogic:
         
         return list(moves)
     
-    def minimax(self, depth: int, alpha: float, beta: float, maximizing: bool) -> Tuple[float, Optional[Tuple[int, int]]]:
-        """Minimax algorithm with alpha-beta pruning"""
+    def search(self, depth: int) -> Tuple[float, Optional[Tuple[int, int]]]:
+        """Search for the AI's best move; nodes_searched counts this search only"""
+        self.nodes_searched = 0
+        return self.minimax(depth, float('-inf'), float('inf'), True)
+    
+    def minimax(self, depth: int, alpha: float, beta: float, maximizing: bool,
+                allow_null: bool = False, threats: Optional[bool] = None) -> Tuple[float, Optional[Tuple[int, int]]]:
+        """Minimax algorithm with alpha-beta pruning, optional LMR and null-move pruning.
+
+        threats says whether either side has a three on the board. It is
+        scanned once at the root and then set by any move that creates one.
+        It is never cleared, so a threat blocked during the search only makes
+        null-move pruning more conservative.
+        """
         board = self.game_logic.board
+        self.nodes_searched += 1
         
         # Check terminal states
         human_wins, _ = self.game_logic.check_win(Player.HUMAN)
@@ -162,12 +213,32 @@ class AILogic:
         if depth == 0 or self.game_logic.is_board_full():
             return self.score_position(Player.AI) - self.score_position(Player.HUMAN), None
         
+        # Null-move pruning: let the side to move pass; if the position still
+        # fails high, verify with a reduced search before cutting off.
+        # Both searches must look at least one ply ahead, otherwise this would
+        # only be a static eval cutoff
+        if threats is None:
+            threats = self.use_null_move and self._has_threats()
+        null_depth = depth - 1 - GameConfig.AI.NULL_MOVE_REDUCTION
+        if self.use_null_move and allow_null and null_depth >= 1 and not threats:
+            null_score, _ = self.minimax(null_depth, alpha, beta, not maximizing, False, threats)
+            if (maximizing and null_score >= beta) or (not maximizing and null_score <= alpha):
+                verify_score, verify_move = self.minimax(depth - GameConfig.AI.NULL_MOVE_REDUCTION,
+                                                         alpha, beta, maximizing, False, threats)
+                if (maximizing and verify_score >= beta) or (not maximizing and verify_score <= alpha):
+                    return verify_score, verify_move
+        
+        player = Player.AI if maximizing else Player.HUMAN
         valid_moves = self.get_adjacent_moves()
         
-        # Limit number of positions to evaluate for performance
-        if len(valid_moves) > GameConfig.AI.MAX_SEARCH_POSITIONS:
+        if self.use_lmr:
+            # LMR relies on the most promising moves for the side to move coming first
+            valid_moves.sort(key=lambda move: self._move_potential(move, player), reverse=True)
+            valid_moves = valid_moves[:GameConfig.AI.MAX_SEARCH_POSITIONS]
+        elif len(valid_moves) > GameConfig.AI.MAX_SEARCH_POSITIONS:
+            # Limit number of positions to evaluate for performance
             # Sort moves by potential and take top N
-            valid_moves.sort(key=lambda move: self._move_potential(move, Player.AI if maximizing else Player.HUMAN), 
+            valid_moves.sort(key=lambda move: self._move_potential(move, player), 
                             reverse=maximizing)
             valid_moves = valid_moves[:GameConfig.AI.MAX_SEARCH_POSITIONS]
         
@@ -175,11 +246,20 @@ class AILogic:
             max_eval = float('-inf')
             best_move = None
             
-            for move in valid_moves:
+            for index, move in enumerate(valid_moves):
                 row, col = move
+                reduce = self._should_reduce(index, depth, move, player)
+                child_threats = threats or (self.use_null_move and self._creates_threat(move, player))
                 board[row][col] = Player.AI.value
                 
-                eval_score, _ = self.minimax(depth-1, alpha, beta, False)
+                if reduce:
+                    eval_score, _ = self.minimax(depth - 1 - GameConfig.AI.LMR_REDUCTION,
+                                                 alpha, beta, False, True, child_threats)
+                    # Re-search at full depth when the reduced search fails high
+                    if eval_score > alpha:
+                        eval_score, _ = self.minimax(depth-1, alpha, beta, False, True, child_threats)
+                else:
+                    eval_score, _ = self.minimax(depth-1, alpha, beta, False, True, child_threats)
                 board[row][col] = Player.EMPTY.value
                 
                 if eval_score > max_eval:
@@ -199,11 +279,20 @@ class AILogic:
             min_eval = float('inf')
             best_move = None
             
-            for move in valid_moves:
+            for index, move in enumerate(valid_moves):
                 row, col = move
+                reduce = self._should_reduce(index, depth, move, player)
+                child_threats = threats or (self.use_null_move and self._creates_threat(move, player))
                 board[row][col] = Player.HUMAN.value
                 
-                eval_score, _ = self.minimax(depth-1, alpha, beta, True)
+                if reduce:
+                    eval_score, _ = self.minimax(depth - 1 - GameConfig.AI.LMR_REDUCTION,
+                                                 alpha, beta, True, True, child_threats)
+                    # Re-search at full depth when the reduced search fails low
+                    if eval_score < beta:
+                        eval_score, _ = self.minimax(depth-1, alpha, beta, True, True, child_threats)
+                else:
+                    eval_score, _ = self.minimax(depth-1, alpha, beta, True, True, child_threats)
                 board[row][col] = Player.EMPTY.value
                 
                 if eval_score < min_eval:
@@ -219,6 +308,68 @@ class AILogic:
             
             return min_eval, best_move
     
+    def _should_reduce(self, index: int, depth: int, move: Tuple[int, int], player: Player) -> bool:
+        """Late move reductions apply only to late-ordered quiet moves"""
+        return (self.use_lmr and
+                index >= GameConfig.AI.LMR_FULL_DEPTH_MOVES and
+                depth >= GameConfig.AI.LMR_MIN_DEPTH and
+                not self._is_tactical_move(move, player))
+    
+    def _line_windows(self, row: int, col: int) -> List[List[Tuple[int, int]]]:
+        """All WIN_LENGTH windows in every direction that contain (row, col)"""
+        windows = []
+        for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+            for offset in range(GameConfig.WIN_LENGTH):
+                start_r, start_c = row - dr*offset, col - dc*offset
+                end_r = start_r + dr*(GameConfig.WIN_LENGTH - 1)
+                end_c = start_c + dc*(GameConfig.WIN_LENGTH - 1)
+                if (0 <= start_r < GameConfig.BOARD_SIZE and 0 <= start_c < GameConfig.BOARD_SIZE and
+                        0 <= end_r < GameConfig.BOARD_SIZE and 0 <= end_c < GameConfig.BOARD_SIZE):
+                    windows.append([(start_r + dr*i, start_c + dc*i) for i in range(GameConfig.WIN_LENGTH)])
+        return windows
+    
+    def _move_window_counts(self, move: Tuple[int, int], player: Player) -> List[Tuple[int, int]]:
+        """(player, opponent) stone counts for every window through an empty cell"""
+        board = self.game_logic.board
+        player_val = player.value
+        opponent_val = Player.HUMAN.value if player == Player.AI else Player.AI.value
+        
+        counts = []
+        for window in self._line_windows(*move):
+            values = [board[r][c] for r, c in window]
+            counts.append((values.count(player_val), values.count(opponent_val)))
+        return counts
+    
+    def _is_tactical_move(self, move: Tuple[int, int], player: Player) -> bool:
+        """A move is tactical if it builds a three or better, or blocks the opponent's three"""
+        return any((player_count >= 2 and opponent_count == 0) or
+                   (opponent_count >= 3 and player_count == 0)
+                   for player_count, opponent_count in self._move_window_counts(move, player))
+    
+    def _creates_threat(self, move: Tuple[int, int], player: Player) -> bool:
+        """True if playing move gives player three or more stones in an otherwise empty window"""
+        return any(player_count >= 2 and opponent_count == 0
+                   for player_count, opponent_count in self._move_window_counts(move, player))
+    
+    def _has_threats(self) -> bool:
+        """True if either side has three or more stones in an otherwise empty window"""
+        board = self.game_logic.board
+        size = GameConfig.BOARD_SIZE
+        length = GameConfig.WIN_LENGTH
+        
+        for row in range(size):
+            for col in range(size):
+                for dr, dc in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                    end_r, end_c = row + dr*(length - 1), col + dc*(length - 1)
+                    if not (0 <= end_r < size and 0 <= end_c < size):
+                        continue
+                    window = [board[row + dr*i][col + dc*i] for i in range(length)]
+                    human_count = window.count(Player.HUMAN.value)
+                    ai_count = window.count(Player.AI.value)
+                    if (human_count >= 3 and ai_count == 0) or (ai_count >= 3 and human_count == 0):
+                        return True
+        return False
+    
     def _move_potential(self, move: Tuple[int, int], player: Player) -> int:
         row, col = move
         board = self.game_logic.board
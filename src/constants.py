@@ -28,6 +28,8 @@ class GameConfig:
     SPACE = SQUARE_SIZE // 4
     LINE_WIDTH = 2
     WIN_LENGTH = 5
+    LOG_GAMES = True
+    GAME_LOG_FILE = "games.caro"  # Finished games are appended here
     
     class Colors:
         WHITE = (255, 255, 255)
@@ -43,4 +45,17 @@ class GameConfig:
         EASY_DEPTH = 1
         MEDIUM_DEPTH = 2
         HARD_DEPTH = 3
-        MAX_SEARCH_POSITIONS = 20
\ No newline at end of file
+        MAX_SEARCH_POSITIONS = 20
+        WEIGHTS_FILE = "weights.json"  # Tuned pattern values, loaded if present
+        MIN_PATTERN_WEIGHT = 1
+        MAX_PATTERN_WEIGHT = 100000    # Keeps static evals well below the 1000000 win score
+        
+        # Selective search options (off by default, toggle for self-play tests)
+        USE_LMR = False
+        LMR_FULL_DEPTH_MOVES = 4   # Moves searched at full depth before reducing
+        LMR_MIN_DEPTH = 3          # Only reduce when this much depth remains
+        LMR_REDUCTION = 1
+        USE_NULL_MOVE = False
+        # The null and verification searches must be at least one ply deep, so with
+        # R = 1 a null move needs depth >= 3 below the root: AILogic.search(depth >= 4)
+        NULL_MOVE_REDUCTION = 1
\ No newline at end of file
@@ -5,6 +5,7 @@ class GameLogic:
     def __init__(self):
         self.board = np.zeros((GameConfig.BOARD_SIZE, GameConfig.BOARD_SIZE), dtype=int)
         self.last_move = None
+        self.move_history = []
     
     def is_valid_move(self, row, col):
         return (0 <= row < GameConfig.BOARD_SIZE and 
@@ -14,6 +15,7 @@ class GameLogic:
     def make_move(self, row, col, player):
         self.board[row][col] = player.value
         self.last_move = (row, col)
+        self.move_history.append((row, col))
     
     def check_win(self, player):
         player_value = player.value
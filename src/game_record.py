@@ -0,0 +1,107 @@
+import mmap
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Tuple
+from src.constants import GameConfig, Player, GameState
+
+# Header: magic, version, board size, first player, result, move count.
+# Each move follows as a single byte: row * board_size + col.
+RECORD_MAGIC = b"CARO"
+RECORD_VERSION = 1
+HEADER_FORMAT = "<4sBBBBH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Result codes belong to the file format, not to GameState's auto() values.
+# They match what version 1 logs were written with.
+RESULT_CODES = {
+    GameState.HUMAN_WIN: 2,
+    GameState.AI_WIN: 3,
+    GameState.DRAW: 4,
+}
+RESULT_STATES = {code: state for state, code in RESULT_CODES.items()}
+
+class GameRecord(NamedTuple):
+    first_player: Player
+    result: GameState
+    moves: List[Tuple[int, int]]
+    
+    def players(self) -> Iterator[Player]:
+        """Players alternate, starting with first_player"""
+        player = self.first_player
+        for _ in self.moves:
+            yield player
+            player = Player.HUMAN if player == Player.AI else Player.AI
+
+def encode_game(moves: List[Tuple[int, int]], first_player: Player, result: GameState) -> bytes:
+    """Pack a finished game into the compact record format"""
+    size = GameConfig.BOARD_SIZE
+    if size * size > 256:
+        raise ValueError(f"Board size {size} does not fit the one-byte move encoding")
+    if result not in RESULT_CODES:
+        raise ValueError(f"Cannot record unfinished game state {result}")
+    header = struct.pack(HEADER_FORMAT, RECORD_MAGIC, RECORD_VERSION, size,
+                         first_player.value, RESULT_CODES[result], len(moves))
+    return header + bytes(row * size + col for row, col in moves)
+
+def write_game(stream: BinaryIO, moves: List[Tuple[int, int]], first_player: Player, result: GameState) -> None:
+    stream.write(encode_game(moves, first_player, result))
+
+def append_game(path: str, moves: List[Tuple[int, int]], first_player: Player, result: GameState) -> None:
+    """Append one game to a log file, creating it if needed"""
+    with open(path, "ab") as f:
+        write_game(f, moves, first_player, result)
+
+def _decode_header(header: bytes) -> Tuple[int, Player, GameState, int]:
+    magic, version, size, first, result, count = struct.unpack(HEADER_FORMAT, header)
+    if magic != RECORD_MAGIC:
+        raise ValueError("Not a game record (bad magic)")
+    if version != RECORD_VERSION:
+        raise ValueError(f"Unsupported game record version {version}")
+    if result not in RESULT_STATES:
+        raise ValueError(f"Unknown game result code {result}")
+    return size, Player(first), RESULT_STATES[result], count
+
+def _decode_moves(data: bytes, size: int) -> List[Tuple[int, int]]:
+    return [divmod(cell, size) for cell in data]
+
+def iter_games(stream: BinaryIO) -> Iterator[GameRecord]:
+    """Read records one at a time from a binary stream"""
+    while True:
+        header = stream.read(HEADER_SIZE)
+        if not header:
+            return
+        if len(header) < HEADER_SIZE:
+            raise ValueError("Truncated game record header")
+        size, first, result, count = _decode_header(header)
+        data = stream.read(count)
+        if len(data) < count:
+            raise ValueError("Truncated game record moves")
+        yield GameRecord(first, result, _decode_moves(data, size))
+
+def iter_games_buffer(buffer) -> Iterator[GameRecord]:
+    """Read records from a bytes-like buffer such as an mmap, slicing one record at a time"""
+    total = len(buffer)
+    offset = 0
+    while offset < total:
+        if offset + HEADER_SIZE > total:
+            raise ValueError("Truncated game record header")
+        size, first, result, count = _decode_header(buffer[offset:offset + HEADER_SIZE])
+        offset += HEADER_SIZE
+        if offset + count > total:
+            raise ValueError("Truncated game record moves")
+        yield GameRecord(first, result, _decode_moves(buffer[offset:offset + count], size))
+        offset += count
+
+def iter_games_mmap(path: str) -> Iterator[GameRecord]:
+    """Yield records from a log file through a memory map, one at a time.
+
+    The map stays open until the generator is exhausted or closed.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return
+        try:
+            yield from iter_games_buffer(mapped)
+        finally:
+            mapped.close()
\ No newline at end of file
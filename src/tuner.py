@@ -0,0 +1,188 @@
+"""Offline Texel-style tuner for AILogic.pattern_values.
+
+Usage: python -m src.tuner games.caro [more.caro ...] --output weights.json
+"""
+import argparse
+import json
+import warnings
+from typing import Dict, Iterable, Iterator, List, Tuple
+import numpy as np
+from src.constants import GameConfig, Player, GameState
+from src.game_play import GameLogic
+from src.ai_logic import AILogic
+from src.game_record import GameRecord, iter_games_mmap
+
+# Game result from the AI's point of view, matching the sign of minimax scores
+RESULT_TARGETS = {
+    GameState.AI_WIN: 1.0,
+    GameState.HUMAN_WIN: 0.0,
+    GameState.DRAW: 0.5,
+}
+FIXED_KEYS = [(5, 0)]  # A completed five is a terminal score, not a tunable weight
+
+def game_positions(record: GameRecord) -> np.ndarray:
+    """Every position reached in a game as flat boards, one row per move"""
+    size = GameConfig.BOARD_SIZE
+    placements = np.zeros((len(record.moves), size * size), dtype=np.int8)
+    for i, ((row, col), player) in enumerate(zip(record.moves, record.players())):
+        placements[i, row * size + col] = player.value
+    return np.cumsum(placements, axis=0, dtype=np.int8)
+
+def iter_position_batches(records: Iterable[GameRecord], batch_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield (boards, targets) batches with boards shaped (batch, size, size).
+
+    records may be a lazy stream; only one batch of games is held at a time.
+    """
+    size = GameConfig.BOARD_SIZE
+    boards, targets, pending = [], [], 0
+    for record in records:
+        if record.result not in RESULT_TARGETS or not record.moves:
+            continue
+        positions = game_positions(record)
+        boards.append(positions)
+        targets.append(np.full(len(positions), RESULT_TARGETS[record.result], dtype=np.float32))
+        pending += len(positions)
+        if pending >= batch_size:
+            yield np.concatenate(boards).reshape(-1, size, size), np.concatenate(targets)
+            boards, targets, pending = [], [], 0
+    if pending:
+        yield np.concatenate(boards).reshape(-1, size, size), np.concatenate(targets)
+
+def window_counts(stones: np.ndarray) -> np.ndarray:
+    """Stone counts for every WIN_LENGTH window in all four directions, shape (batch, windows)"""
+    size, length = GameConfig.BOARD_SIZE, GameConfig.WIN_LENGTH
+    n = size - length + 1
+    horizontal = sum(stones[:, :, i:n+i] for i in range(length))
+    vertical = sum(stones[:, i:n+i, :] for i in range(length))
+    diagonal_main = sum(stones[:, i:n+i, i:n+i] for i in range(length))
+    diagonal_counter = sum(stones[:, i:n+i, length-1-i:length-1-i+n] for i in range(length))
+    batch = stones.shape[0]
+    return np.concatenate([horizontal.reshape(batch, -1), vertical.reshape(batch, -1),
+                           diagonal_main.reshape(batch, -1), diagonal_counter.reshape(batch, -1)], axis=1)
+
+def extract_features(boards: np.ndarray, keys: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pattern counts per key (AI minus human) and the fixed positional bonus, batched.
+
+    score_position is linear in pattern_values, so
+    eval = features @ weights + bonus reproduces AILogic's static evaluation.
+    """
+    ai = window_counts((boards == Player.AI.value).astype(np.int8))
+    human = window_counts((boards == Player.HUMAN.value).astype(np.int8))
+    features = np.empty((boards.shape[0], len(keys)), dtype=np.float32)
+    for k, (player_count, opponent_count) in enumerate(keys):
+        ai_side = np.count_nonzero((ai == player_count) & (human == opponent_count), axis=1)
+        human_side = np.count_nonzero((human == player_count) & (ai == opponent_count), axis=1)
+        features[:, k] = ai_side - human_side
+    
+    # Center and corner bonuses from score_position
+    def owner(cells):
+        return (cells == Player.AI.value).astype(np.float32) - (cells == Player.HUMAN.value)
+    last, center = GameConfig.BOARD_SIZE - 1, GameConfig.BOARD_SIZE // 2
+    bonus = 20 * owner(boards[:, center, center])
+    for row, col in [(0, 0), (0, last), (last, 0), (last, last)]:
+        bonus += 5 * owner(boards[:, row, col])
+    return features, bonus
+
+def load_dataset(paths: List[str], keys: List[Tuple[int, int]], batch_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    features, bonuses, targets = [], [], []
+    for path in paths:
+        for boards, batch_targets in iter_position_batches(iter_games_mmap(path), batch_size):
+            batch_features, batch_bonus = extract_features(boards, keys)
+            features.append(batch_features)
+            bonuses.append(batch_bonus)
+            targets.append(batch_targets)
+    if not features:
+        raise ValueError("No finished games found in the given logs")
+    return np.concatenate(features), np.concatenate(bonuses), np.concatenate(targets)
+
+def sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(x, -50, 50)))
+
+def mean_error(evals: np.ndarray, targets: np.ndarray, k: float) -> float:
+    return float(np.mean((sigmoid(k * evals) - targets) ** 2))
+
+def fit_scale(evals: np.ndarray, targets: np.ndarray) -> float:
+    """Pick the sigmoid scale K that best fits the current weights.
+
+    A coarse grid over log10(K) brackets the minimum, then golden-section
+    search refines it between the neighbouring grid points.
+    """
+    exponents = np.linspace(-12, 0, 97)
+    errors = [mean_error(evals, targets, 10 ** e) for e in exponents]
+    best = int(np.argmin(errors))
+    if best in (0, len(exponents) - 1):
+        warnings.warn(f"Best scale K = 1e{exponents[best]:.2f} lies on the search bound")
+        return float(10 ** exponents[best])
+    
+    low, high = exponents[best - 1], exponents[best + 1]
+    ratio = (np.sqrt(5) - 1) / 2
+    for _ in range(40):
+        left, right = high - ratio * (high - low), low + ratio * (high - low)
+        if mean_error(evals, targets, 10 ** left) < mean_error(evals, targets, 10 ** right):
+            high = right
+        else:
+            low = left
+    return float(10 ** ((low + high) / 2))
+
+def tune(features: np.ndarray, bonus: np.ndarray, targets: np.ndarray, initial: np.ndarray,
+         tunable: np.ndarray, k: float, iterations: int, learning_rate: float) -> Tuple[np.ndarray, float]:
+    """Minimize the Texel error with Adam on log-weights, for a fixed sigmoid scale k.
+
+    Tunable weights are clamped to [MIN_PATTERN_WEIGHT, MAX_PATTERN_WEIGHT], so
+    the static eval cannot outrank a real win and no weight collapses to zero.
+    """
+    lower = np.where(tunable, np.log(GameConfig.AI.MIN_PATTERN_WEIGHT / initial), 0)
+    upper = np.where(tunable, np.log(GameConfig.AI.MAX_PATTERN_WEIGHT / initial), 0)
+    theta = np.zeros_like(initial)
+    m, v = np.zeros_like(theta), np.zeros_like(theta)
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    
+    for step in range(1, iterations + 1):
+        weights = initial * np.exp(theta)
+        predicted = sigmoid(k * (features @ weights + bonus))
+        residual = 2 * (predicted - targets) * predicted * (1 - predicted) * k
+        grad = (residual @ features) / len(targets) * weights
+        grad[~tunable] = 0
+        m = beta1 * m + (1 - beta1) * grad
+        v = beta2 * v + (1 - beta2) * grad ** 2
+        theta -= learning_rate * (m / (1 - beta1 ** step)) / (np.sqrt(v / (1 - beta2 ** step)) + eps)
+        theta = np.clip(theta, lower, upper)
+    
+    weights = initial * np.exp(theta)
+    return weights, mean_error(features @ weights + bonus, targets, k)
+
+def write_weights(path: str, keys: List[Tuple[int, int]], weights: np.ndarray, **stats) -> None:
+    pattern_values: Dict[str, int] = {f"{p},{o}": int(round(w)) for (p, o), w in zip(keys, weights)}
+    with open(path, "w") as f:
+        json.dump({"pattern_values": pattern_values, **stats}, f, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune AI pattern weights from logged games")
+    parser.add_argument("logs", nargs="+", help="Game record files")
+    parser.add_argument("--output", default=GameConfig.AI.WEIGHTS_FILE)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--learning-rate", type=float, default=0.05)
+    parser.add_argument("--batch-size", type=int, default=65536, help="Positions per feature batch")
+    args = parser.parse_args()
+    
+    # Start from the weights the AI currently uses, including any earlier tuning
+    pattern_values = AILogic(GameLogic()).pattern_values
+    keys = list(pattern_values)
+    initial = np.array([pattern_values[key] for key in keys], dtype=np.float64)
+    tunable = np.array([key not in FIXED_KEYS for key in keys])
+    # A weight of zero would never move again under the log-weight parametrization
+    initial[tunable] = np.clip(initial[tunable], GameConfig.AI.MIN_PATTERN_WEIGHT,
+                               GameConfig.AI.MAX_PATTERN_WEIGHT)
+    
+    features, bonus, targets = load_dataset(args.logs, keys, args.batch_size)
+    features, bonus, targets = features.astype(np.float64), bonus.astype(np.float64), targets.astype(np.float64)
+    initial_evals = features @ initial + bonus
+    k = fit_scale(initial_evals, targets)
+    initial_error = mean_error(initial_evals, targets, k)
+    weights, error = tune(features, bonus, targets, initial, tunable, k, args.iterations, args.learning_rate)
+    
+    write_weights(args.output, keys, weights, scale_k=k, positions=int(len(targets)), error=error)
+    print(f"{len(targets)} positions, error {initial_error:.6f} -> {error:.6f}, written to {args.output}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file